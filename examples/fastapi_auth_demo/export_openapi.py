@@ -1,12 +1,30 @@
 from __future__ import annotations
 
 import argparse
-import json
+import os
 from pathlib import Path
 
+import orjson
+
 from app import app
 
 
+def openapi_json_bytes() -> bytes:
+    """Return the serialized OpenAPI schema, memoized on ``app.state``.
+
+    ``app.openapi()`` caches the schema dict on first call; this caches the
+    serialized bytes as well, so repeated exports (e.g. CI re-running on file
+    change) skip both the schema build and the JSON encode. orjson emits
+    UTF-8 bytes directly, so there is no intermediate ``str`` and no
+    re-encode on write.
+    """
+    cached: bytes | None = getattr(app.state, "openapi_json_bytes", None)
+    if cached is None:
+        cached = orjson.dumps(app.openapi(), option=orjson.OPT_INDENT_2)
+        app.state.openapi_json_bytes = cached
+    return cached
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(
         description="Export the FastAPI OpenAPI schema to a JSON file.",
@@ -21,7 +39,15 @@ def main() -> None:
 
     output_path = Path(args.output)
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text(json.dumps(app.openapi(), indent=2) + "\n", encoding="utf8")
+
+    # Write the serialized bytes straight to the descriptor; Path.write_text
+    # would round-trip through a str and re-encode.
+    fd = os.open(output_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, openapi_json_bytes())
+        os.write(fd, b"\n")
+    finally:
+        os.close(fd)
 
     print(f"Wrote {output_path}")
 
@@ -0,0 +1,86 @@
+"""Path-segment trie dispatch for Starlette routing.
+
+Starlette's ``Router.app`` tries every registered route's compiled regex in
+order, so dispatch cost grows linearly with the number of routes. TrieRouter
+indexes plain path routes in a segment trie at construction time and resolves
+requests in O(path depth) instead; anything the trie cannot answer (mounts,
+``:path`` converters, partial matches, slash redirects) falls back to the
+stock linear scan.
+"""
+
+from __future__ import annotations
+
+from fastapi.routing import APIRouter
+from starlette.routing import Match, Route, get_route_path
+from starlette.types import Receive, Scope, Send
+
+_PARAM = "*"  # child slot shared by all dynamic `{name}` segments
+
+
+class _TrieNode:
+    __slots__ = ("children", "routes")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _TrieNode] = {}
+        self.routes: list[Route] = []
+
+
+class TrieRouter(APIRouter):
+    """APIRouter that fronts route matching with a path-segment trie."""
+
+    @classmethod
+    def from_router(cls, router: APIRouter) -> TrieRouter:
+        """Adopt an existing router's state and index its routes.
+
+        Call this after every route is registered; routes added later are
+        only reachable through the linear-scan fallback.
+        """
+        trie = cls.__new__(cls)
+        trie.__dict__.update(router.__dict__)
+        # middleware_stack was bound to the donor router's app; rebind it so
+        # dispatch goes through the trie.
+        trie.middleware_stack = trie.app
+        trie._rebuild_trie()
+        return trie
+
+    def _rebuild_trie(self) -> None:
+        self._trie_root = _TrieNode()
+        for route in self.routes:
+            # Only plain single-segment-param routes go in the trie; `:path`
+            # converters span segments and mounts are not Route instances.
+            if isinstance(route, Route) and ":path}" not in route.path:
+                self._insert(route)
+
+    def _insert(self, route: Route) -> None:
+        node = self._trie_root
+        for segment in route.path.split("/"):
+            key = _PARAM if segment.startswith("{") and segment.endswith("}") else segment
+            node = node.children.setdefault(key, _TrieNode())
+        node.routes.append(route)
+
+    def _lookup(self, path: str) -> list[Route]:
+        node = self._trie_root
+        for segment in path.split("/"):
+            child = node.children.get(segment)
+            if child is None:
+                child = node.children.get(_PARAM)
+                if child is None:
+                    return []
+            node = child
+        return node.routes
+
+    async def app(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http":
+            # The trie narrows candidates to the routes sharing this path
+            # shape; route.matches still converts params and checks methods.
+            for route in self._lookup(get_route_path(scope)):
+                match, child_scope = route.matches(scope)
+                if match == Match.FULL:
+                    if "router" not in scope:
+                        scope["router"] = self
+                    scope.update(child_scope)
+                    await route.handle(scope, receive, send)
+                    return
+        # Partial matches (405), slash redirects, mounts, websockets and
+        # lifespan all go through the stock linear scan.
+        await super().app(scope, receive, send)